@@ -4,9 +4,17 @@ Advent of Code 2025 - Day 3: Lobby.
 Basic/Straightforward Solution - clear and readable approach.
 - Part 1 brute-forces all (i < j) 2-digit combinations.
 - Part 2 uses a simple greedy scanning approach for selecting a
-  maximum-value length-12 subsequence.
+  maximum-value length-12 subsequence. Wide windows without a '9' (where
+  the scan cannot stop early) are answered by a sparse-table range-max
+  query instead.
 """
 
+from src.aoc2025.solutions.day03.utils import SparseTable
+
+# Windows at least this wide, with no '9' to stop the scan early, use the
+# sparse table; building it costs about as much as scanning a few hundred
+# digits.
+SPARSE_MIN_WINDOW: int = 256
 
 # =============================================================================
 # SOLUTION 2: BASIC / STRAIGHTFORWARD
@@ -32,6 +40,9 @@ def best_k_digit(bank: str, k: int) -> int:
     if k > n:
         raise ValueError("Bank has fewer than k digits.")
 
+    # Range-max index, built on first need
+    table: SparseTable | None = None
+
     remaining: int = k
     start = 0
     out: list[str] = []
@@ -43,14 +54,24 @@ def best_k_digit(bank: str, k: int) -> int:
         best_digit = "0"
         best_index: int = start
 
-        # Scan window
-        for idx in range(start, last_pos + 1):
-            d: str = bank[idx]
-            if d > best_digit:
-                best_digit: str = d
-                best_index = idx
-                if d == "9":  # can't do better
-                    break
+        if (
+            last_pos - start < SPARSE_MIN_WINDOW
+            or bank.find("9", start, last_pos + 1) >= 0
+        ):
+            # Scan window
+            for idx in range(start, last_pos + 1):
+                d: str = bank[idx]
+                if d > best_digit:
+                    best_digit: str = d
+                    best_index = idx
+                    if d == "9":  # can't do better
+                        break
+        else:
+            # Wide window with no early exit: leftmost largest digit in O(1)
+            if table is None:
+                table = SparseTable(bank)
+            best_index = table.argmax(start, last_pos)
+            best_digit = bank[best_index]
 
         out.append(best_digit)
         start: int = best_index + 1
@@ -0,0 +1,107 @@
+"""
+Advent of Code 2025 - Day 3: Lobby.
+
+Parallel Solution - process-pool sharding of independent banks.
+- The input file is split into byte ranges that end on newline boundaries.
+- Workers receive only (path, start, end), memory-map the file themselves
+  and run the streaming kernels over their shard for both parts at once.
+- Partial (part1, part2) sums are reduced in the parent.
+- Small inputs skip the pool entirely; process start-up would dominate.
+"""
+
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from src.aoc2025.solutions.day03.streaming import solve_buffer
+from src.aoc2025.solutions.day03.utils import map_input
+
+# =============================================================================
+# SOLUTION 6: PARALLEL / SHARDED
+# =============================================================================
+
+# Below this size a single streaming pass beats spinning up workers.
+MIN_PARALLEL_BYTES: int = 1 << 20
+
+
+def shard_offsets(buffer: bytes, shards: int) -> list[tuple[int, int]]:
+    """
+    Split buffer into at most `shards` byte ranges on newline boundaries.
+
+    Every range starts at the beginning of a line and ends just past a
+    newline (or at the end of the buffer), so no bank straddles two shards.
+    """
+    size: int = len(buffer)
+    bounds: list[int] = [0]
+    for i in range(1, shards):
+        target: int = max(size * i // shards, bounds[-1])
+        newline: int = buffer.find(b"\n", target)
+        bounds.append(size if newline == -1 else newline + 1)
+    bounds.append(size)
+
+    return [(lo, hi) for lo, hi in itertools.pairwise(bounds) if lo < hi]
+
+
+def _solve_shard(shard: tuple[str, int, int]) -> tuple[int, int]:
+    """Worker entry point: map the file and solve one byte range."""
+    input_path, start, end = shard
+    with map_input(input_path) as buffer:
+        return solve_buffer(buffer, start, end)
+
+
+def solve(
+    input_path: str | Path,
+    workers: int | None = None,
+    min_parallel_bytes: int = MIN_PARALLEL_BYTES,
+) -> tuple[int, int]:
+    """
+    Return (part1, part2), fanning shards out to a process pool.
+
+    Args:
+        input_path: Puzzle input file
+        workers: Number of worker processes (defaults to os.cpu_count())
+        min_parallel_bytes: Inputs smaller than this run in-process
+
+    """
+    workers = workers or os.cpu_count() or 1
+
+    with map_input(input_path) as buffer:
+        if workers == 1 or len(buffer) < min_parallel_bytes:
+            return solve_buffer(buffer)
+        shards: list[tuple[int, int]] = shard_offsets(buffer, workers)
+
+    path: str = str(input_path)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        partials = pool.map(_solve_shard, [(path, lo, hi) for lo, hi in shards])
+        total1: int = 0
+        total2: int = 0
+        for p1, p2 in partials:
+            total1 += p1
+            total2 += p2
+
+    return total1, total2
+
+
+# =============================================================================
+# MAIN
+# =============================================================================
+if __name__ == "__main__":
+    import time
+
+    for label, path in (
+        ("example", "src/aoc2025/solutions/day03/example.txt"),
+        ("real puzzle input", "src/aoc2025/solutions/day03/input.txt"),
+    ):
+        if not Path(path).exists():
+            print(f"\n({label.capitalize()} not found - skipping)")
+            continue
+
+        print(f"Testing with {label}:")
+        start: float = time.perf_counter()
+        p1_answer, p2_answer = solve(path)
+        both_time: float = time.perf_counter() - start
+
+        print(f"Part 1: {p1_answer: 16}")
+        print(f"Part 2: {p2_answer: 16}")
+        print(f"Both parts, sharded: ({both_time * 1000:7.3f}ms)")
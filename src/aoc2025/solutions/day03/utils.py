@@ -4,9 +4,103 @@ Advent of Code 2025 - Day 3: Lobby.
 Utility file for this day's solutions.
 """
 
+from __future__ import annotations
+
+import mmap
+from contextlib import contextmanager
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
 
 
 def parse(input_path: str | Path) -> list[str]:
     text: str = Path(input_path).read_text().strip()
     return text.splitlines()
+
+
+@contextmanager
+def map_input(input_path: str | Path) -> Iterator[mmap.mmap | bytes]:
+    """Memory-map the puzzle input read-only (empty files map to b"")."""
+    with Path(input_path).open("rb") as f:
+        if f.seek(0, 2) == 0:
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+
+def iter_banks(
+    buffer: mmap.mmap | bytes,
+    start: int = 0,
+    end: int | None = None,
+) -> Iterator[memoryview]:
+    """
+    Yield every non-empty line of buffer[start:end] as a zero-copy view.
+
+    Each bank is a `memoryview` of ASCII digits, so iterating it yields
+    ints offset by ord("0"). A view is released as soon as the caller asks
+    for the next bank, which lets the underlying mmap close cleanly.
+    """
+    if end is None:
+        end = len(buffer)
+
+    with memoryview(buffer) as view:
+        pos: int = start
+        while pos < end:
+            newline: int = buffer.find(b"\n", pos, end)
+            stop: int = end if newline == -1 else newline
+
+            # Tolerate CRLF input without creating a stripped copy
+            line_end: int = stop
+            if line_end > pos and buffer[line_end - 1] == ord("\r"):
+                line_end -= 1
+
+            if line_end > pos:
+                with view[pos:line_end] as bank:
+                    yield bank
+            pos = stop + 1
+
+
+class SparseTable:
+    """
+    Range-maximum index over a bank of digits.
+
+    After an O(n log n) build, `argmax(lo, hi)` returns the position of the
+    largest digit in the inclusive window [lo, hi] in O(1). Ties resolve to
+    the leftmost position, which is what the greedy subsequence pick needs.
+
+    Level j stores, for every start i, the leftmost maximum of the 2**j
+    digits beginning at i. Each level is one NumPy `where` over two shifted
+    halves of the previous level, so the build never loops in Python.
+    """
+
+    __slots__ = ("digits", "levels", "n")
+
+    def __init__(self, digits: str | bytes) -> None:
+        self.digits: bytes = digits.encode() if isinstance(digits, str) else digits
+        self.n: int = len(self.digits)
+
+        d: np.ndarray = np.frombuffer(self.digits, dtype=np.uint8)
+        level: np.ndarray = np.arange(self.n)
+        self.levels: list[np.ndarray] = [level]
+
+        width: int = 1
+        while width * 2 <= self.n:
+            # Level j combines the level-(j-1) entries at i and i + 2**(j-1)
+            a: np.ndarray = level[:-width]
+            b: np.ndarray = level[width:]
+            level = np.where(d[a] >= d[b], a, b)
+            self.levels.append(level)
+            width *= 2
+
+    def argmax(self, lo: int, hi: int) -> int:
+        """Return the leftmost position of the largest digit in [lo, hi]."""
+        level: int = (hi - lo + 1).bit_length() - 1
+        row: np.ndarray = self.levels[level]
+        a: int = int(row[lo])
+        b: int = int(row[hi - (1 << level) + 1])
+        return a if self.digits[a] >= self.digits[b] else b
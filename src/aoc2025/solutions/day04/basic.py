@@ -5,23 +5,12 @@ Basic/Straightforward Solution - clear and readable approach.
 - brute-force neighbor scanning and repeated grid updates.
 """
 
+from src.aoc2025.solutions.day04.utils import D8, DEFAULT_THRESHOLD
 
 # =============================================================================
 # SOLUTION 2: BASIC / STRAIGHTFORWARD
 # =============================================================================
 
-# 8 directions
-D8: list[tuple[int, int]] = [
-    (-1, -1),
-    (-1, 0),
-    (-1, 1),
-    (0, -1),
-    (0, 1),
-    (1, -1),
-    (1, 0),
-    (1, 1),
-]
-
 
 def count_adjacent(grid: list[list[str]], r: int, c: int) -> int:
     """Count how many of the 8 neighbors are '@'."""
@@ -40,15 +29,11 @@ def part1(data: list[str]) -> int:
     grid: list[list[str]] = [list(row.rstrip()) for row in data]
     h: int = len(grid)
     w: int = len(grid[0])
-    adjacent_roll_threshold: int = 4
     total = 0
 
     for r in range(h):
         for c in range(w):
-            if (
-                grid[r][c] == "@"
-                and count_adjacent(grid, r, c) < adjacent_roll_threshold
-            ):
+            if grid[r][c] == "@" and count_adjacent(grid, r, c) < DEFAULT_THRESHOLD:
                 total += 1
     return total
 
@@ -62,7 +47,6 @@ def part2(data: list[str]) -> int:
     grid: list[list[str]] = [list(row.rstrip()) for row in data]
     h: int = len(grid)
     w: int = len(grid[0])
-    adjacent_roll_threshold: int = 4
     removed_total = 0
 
     while True:
@@ -70,10 +54,7 @@ def part2(data: list[str]) -> int:
 
         for r in range(h):
             for c in range(w):
-                if (
-                    grid[r][c] == "@"
-                    and count_adjacent(grid, r, c) < adjacent_roll_threshold
-                ):
+                if grid[r][c] == "@" and count_adjacent(grid, r, c) < DEFAULT_THRESHOLD:
                     to_remove.append((r, c))
 
         if not to_remove:
@@ -88,7 +88,17 @@ def compare_solutions(
 
     """
     if solutions is None:
-        solutions = ["initial", "basic", "optimized", "elegant"]
+        solutions = [
+            "initial",
+            "basic",
+            "optimized",
+            "elegant",
+            "vectorized",
+            "bitboard",
+            "layers",
+            "incremental",
+            "parallel",
+        ]
 
     results: list[SolutionResult] = []
 
@@ -11,6 +11,8 @@ from collections import deque
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+from src.aoc2025.solutions.day04.utils import D8, DEFAULT_THRESHOLD
+
 if TYPE_CHECKING:
     from collections.abc import Iterable
 
@@ -18,18 +20,6 @@ if TYPE_CHECKING:
 # SOLUTION 4: ALTERNATIVE / ELEGANT
 # =============================================================================
 
-# 8 directions
-D8: list[tuple[int, int]] = [
-    (-1, -1),
-    (-1, 0),
-    (-1, 1),
-    (0, -1),
-    (0, 1),
-    (1, -1),
-    (1, 0),
-    (1, 1),
-]
-
 
 @dataclass
 class Grid:
@@ -63,19 +53,15 @@ class Grid:
 
 def part1(data: list[str]) -> int:
     g = Grid([list(row.rstrip()) for row in data])
-    adjacent_roll_threshold: int = 4
-
     count = 0
     for r, c in g.all_coords():
-        if g.cells[r][c] == "@" and g.count_adj(r, c) < adjacent_roll_threshold:
+        if g.cells[r][c] == "@" and g.count_adj(r, c) < DEFAULT_THRESHOLD:
             count += 1
     return count
 
 
 def part2(data: list[str]) -> int:
     g = Grid([list(row.rstrip()) for row in data])
-    adjacent_roll_threshold: int = 4
-
     # Precompute adjacency counts for all '@'
     adj: list[list[int]] = [[0] * g.w for _ in range(g.h)]
     for r, c in g.all_coords():
@@ -84,7 +70,7 @@ def part2(data: list[str]) -> int:
 
     q: deque = deque()
     for r, c in g.all_coords():
-        if g.cells[r][c] == "@" and adj[r][c] < adjacent_roll_threshold:
+        if g.cells[r][c] == "@" and adj[r][c] < DEFAULT_THRESHOLD:
             q.append((r, c))
 
     removed = 0
@@ -101,7 +87,7 @@ def part2(data: list[str]) -> int:
         for rr, cc in g.neighbors8(r, c):
             if g.cells[rr][cc] == "@":
                 adj[rr][cc] -= 1
-                if adj[rr][cc] < adjacent_roll_threshold:
+                if adj[rr][cc] < DEFAULT_THRESHOLD:
                     q.append((rr, cc))
 
     return removed
@@ -4,6 +4,8 @@ Advent of Code 2025 - Day 4: Printing Department.
 My initial working solution - first draft before refactoring.
 """
 
+from src.aoc2025.solutions.day04.utils import DEFAULT_THRESHOLD
+
 
 # =============================================================================
 # SOLUTION 1: My Initial Solution
@@ -84,8 +86,7 @@ def part1(data: list[str]) -> int:
             # print(f"{row}{column}: {data[row][column]}")
             # print(check_for_paper)
             # print()
-            paper_roll_threshold: int = 4
-            if sum(check_for_paper) < paper_roll_threshold and data[row][column] == "@":
+            if sum(check_for_paper) < DEFAULT_THRESHOLD and data[row][column] == "@":
                 accessible_paper_rolls += 1
             if verbose:
                 print(data[row][column], end="")
@@ -170,9 +171,8 @@ def part2(data: list[str]) -> int:
                     check_for_paper[6] = data[row][column - 1] == "@"
                     check_for_paper[7] = data[row - 1][column - 1] == "@"
 
-                paper_roll_threshold: int = 4
                 if (
-                    sum(check_for_paper) < paper_roll_threshold
+                    sum(check_for_paper) < DEFAULT_THRESHOLD
                     and data[row][column] == "@"
                 ):
                     accessible_paper_rolls_this_round += 1
@@ -0,0 +1,136 @@
+"""
+Advent of Code 2025 - Day 4: Printing Department.
+
+Peel-Depth Solution - which round removes each roll.
+- A bucket queue over the `compute_initial_counts` adjacency assigns every
+  roll the round in which it first becomes removable (a k-core layering).
+- Every roll enters exactly one bucket and is expanded exactly once, so the
+  whole layer map costs O(cells) instead of one grid scan per round.
+- The result is a compact NumPy array; both parts fall out of it.
+"""
+
+import numpy as np
+
+from src.aoc2025.solutions.day04.optimized import compute_initial_counts
+from src.aoc2025.solutions.day04.utils import D8, DEFAULT_THRESHOLD
+
+# =============================================================================
+# SOLUTION 7: PEEL DEPTH / LAYERS
+# =============================================================================
+
+
+def peel_layers(data: list[str], threshold: int = DEFAULT_THRESHOLD) -> np.ndarray:
+    """
+    Return a (h, w) array holding the removal round of every roll.
+
+    Round 1 holds the rolls accessible in the original grid; round k + 1
+    holds the rolls that become accessible once rounds 1..k are gone - the
+    same rounds `initial.part2` discovers by rescanning the grid. Empty
+    cells and rolls that are never removed are 0. The dtype is the
+    smallest unsigned type that fits the deepest round.
+    """
+    grid: list[list[str]] = [list(row.rstrip()) for row in data]
+    h: int = len(grid)
+    w: int = len(grid[0])
+    adj: list[list[int]] = compute_initial_counts(grid)
+
+    depth: list[list[int]] = [[0] * w for _ in range(h)]
+
+    # Bucket for round 1: everything accessible up front
+    bucket: list[tuple[int, int]] = []
+    for r in range(h):
+        for c in range(w):
+            if grid[r][c] == "@" and adj[r][c] < threshold:
+                depth[r][c] = 1
+                bucket.append((r, c))
+
+    layer: int = 1
+    while bucket:
+        next_bucket: list[tuple[int, int]] = []
+
+        for r, c in bucket:
+            for dr, dc in D8:
+                rr, cc = r + dr, c + dc
+                if not (0 <= rr < h and 0 <= cc < w):
+                    continue
+
+                # Only rolls without a round yet still need their count
+                if grid[rr][cc] == "@" and not depth[rr][cc]:
+                    adj[rr][cc] -= 1
+                    if adj[rr][cc] < threshold:
+                        depth[rr][cc] = layer + 1
+                        next_bucket.append((rr, cc))
+
+        if next_bucket:
+            layer += 1
+        bucket = next_bucket
+
+    return np.array(depth, dtype=np.min_scalar_type(layer))
+
+
+def part1(data: list[str]) -> int:
+    return int(np.count_nonzero(peel_layers(data) == 1))
+
+
+def part2(data: list[str]) -> int:
+    return int(np.count_nonzero(peel_layers(data)))
+
+
+# =============================================================================
+# MAIN
+# =============================================================================
+if __name__ == "__main__":
+    import time
+
+    from src.aoc2025.solutions.day04.utils import parse
+
+    # Example data
+    example: list[str] = parse("src/aoc2025/solutions/day04/example.txt")
+    print("Testing with example data:")
+    try:
+        # Time Part 1
+        start: float = time.perf_counter()
+        p1_answer: int = part1(example)
+        p1_time: float = time.perf_counter() - start
+
+        print(f"Part 1: {p1_answer: 4} ({p1_time * 1000:7.3f}ms)")
+    except NameError as e:
+        print(f"Warning: Solution 'Initial' missing required function: {e}")
+
+    try:
+        # Time Part 2
+        start: float = time.perf_counter()
+        p2_answer: int = part2(example)
+        p2_time: float = time.perf_counter() - start
+
+        print(f"Part 2: {p2_answer: 4} ({p2_time * 1000:7.3f}ms)")
+    except NameError as e:
+        print(f"Warning: Solution 'Initial' missing required function: {e}  - skipping")
+
+    # Real data
+    try:
+        data: list[str] = parse("src/aoc2025/solutions/day04/input.txt")
+        print("\n\nTesting with real puzzle input:")
+        try:
+            # Time Part 1
+            start: float = time.perf_counter()
+            p1_answer: int = part1(data)
+            p1_time: float = time.perf_counter() - start
+
+            print(f"Part 1: {p1_answer: 4} ({p1_time * 1000:7.3f}ms)")
+        except NameError as e:
+            print(f"Warning: Solution 'Initial' missing required function: {e}")
+
+        try:
+            # Time Part 2
+            start: float = time.perf_counter()
+            p2_answer: int = part2(data)
+            p2_time: float = time.perf_counter() - start
+
+            print(f"Part 2: {p2_answer: 4} ({p2_time * 1000:7.3f}ms)")
+        except NameError as e:
+            print(
+                f"Warning: Solution 'Initial' missing required function: {e}  - skipping",
+            )
+    except FileNotFoundError:
+        print("\n(Real puzzle input not found - skipping)")
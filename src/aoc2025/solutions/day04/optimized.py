@@ -3,26 +3,15 @@ Advent of Code 2025 - Day 4: Printing Department.
 
 Optimized/Efficient Solution - mathematical approach for performance.
 - Efficient peeling using a queue of potentially-accessible cells.
+- Part 2 peels on a flat, sentinel-padded grid (no bounds checks).
 """
 
-from collections import deque
+from src.aoc2025.solutions.day04.utils import D8, DEFAULT_THRESHOLD, PaddedGrid
 
 # =============================================================================
 # SOLUTION 3: OPTIMIZED / EFFICIENT
 # =============================================================================
 
-# 8 directions
-D8: list[tuple[int, int]] = [
-    (-1, -1),
-    (-1, 0),
-    (-1, 1),
-    (0, -1),
-    (0, 1),
-    (1, -1),
-    (1, 0),
-    (1, 1),
-]
-
 
 def compute_initial_counts(grid: list[list[str]]) -> list[list[int]]:
     """Precompute adjacency counts for all cells."""
@@ -45,14 +34,12 @@ def part1(data: list[str]) -> int:
     grid: list[list[str]] = [list(row.rstrip()) for row in data]
     adj: list[list[int]] = compute_initial_counts(grid)
 
-    adjacent_roll_threshold: int = 4
-
     total = 0
     h: int = len(grid)
     w: int = len(grid[0])
     for r in range(h):
         for c in range(w):
-            if grid[r][c] == "@" and adj[r][c] < adjacent_roll_threshold:
+            if grid[r][c] == "@" and adj[r][c] < DEFAULT_THRESHOLD:
                 total += 1
     return total
 
@@ -63,42 +50,12 @@ def part2(data: list[str]) -> int:
 
     Each time a roll is removed, update adjacency counts of neighbors.
     If any neighbor now becomes accessible, enqueue it.
-    """
-    grid: list[list[str]] = [list(row.rstrip()) for row in data]
-    h: int = len(grid)
-    w: int = len(grid[0])
-
-    adjacent_roll_threshold: int = 4
-
-    adj: list[list[int]] = compute_initial_counts(grid)
-    q: deque[tuple[int, int]] = deque()
 
-    # Initialize queue with all accessible rolls
-    for r in range(h):
-        for c in range(w):
-            if grid[r][c] == "@" and adj[r][c] < adjacent_roll_threshold:
-                q.append((r, c))
-
-    removed = 0
-
-    while q:
-        r, c = q.popleft()
-        if grid[r][c] != "@":
-            continue  # might already be removed
-
-        # Remove this roll
-        grid[r][c] = "."
-        removed += 1
-
-        # Update adjacency of neighbors
-        for dr, dc in D8:
-            rr, cc = r + dr, c + dc
-            if 0 <= rr < h and 0 <= cc < w and grid[rr][cc] == "@":
-                adj[rr][cc] -= 1
-                if adj[rr][cc] < adjacent_roll_threshold:
-                    q.append((rr, cc))
-
-    return removed
+    The grid is flat with a sentinel border (see `PaddedGrid`): neighbours
+    are integer offsets, so there are no bounds checks or tuple allocations,
+    and an in-queue bitmap ensures every roll is enqueued at most once.
+    """
+    return PaddedGrid(data).peel(DEFAULT_THRESHOLD)
 
 
 # =============================================================================
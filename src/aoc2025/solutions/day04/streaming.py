@@ -0,0 +1,127 @@
+"""
+Advent of Code 2025 - Day 4: Printing Department.
+
+Streaming Solution - Part 1 for grids larger than memory.
+- The input is memory-mapped and read one row at a time.
+- Only a three-row sliding window (above, current, below) is kept, so
+  memory stays constant in grid height.
+- Each window row is evaluated either with the big-int bitboard kernel or
+  with a NumPy fast path (vertical sum, then a 3-wide horizontal sum).
+- Part 2 peeling is global, so it has no streaming equivalent here.
+"""
+
+from __future__ import annotations
+
+from itertools import chain
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from src.aoc2025.solutions.day04.bitboard import ROW_BITS, accessible_row
+from src.aoc2025.solutions.day04.utils import DEFAULT_THRESHOLD, iter_rows, map_input
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from pathlib import Path
+
+# =============================================================================
+# SOLUTION 9: STREAMING / ROW WINDOW
+# =============================================================================
+
+
+def _windows[T](rows: Iterable[T], empty: T) -> Iterator[tuple[T, T, T]]:
+    """Yield (above, row, below) for every row, padding the ends with empty."""
+    above: T = empty
+    row: T | None = None
+    for below in rows:
+        if row is not None:
+            yield above, row, below
+            above = row
+        row = below
+    if row is not None:
+        yield above, row, empty
+
+
+def _count_bitboard(rows: Iterator[memoryview]) -> int:
+    """Count accessible rolls, holding three rows as big ints."""
+    first: memoryview | None = next(rows, None)
+    if first is None:
+        return 0
+    full: int = (1 << len(first)) - 1
+
+    ints: Iterator[int] = (
+        int(str(row, "ascii").translate(ROW_BITS)[::-1], 2)
+        for row in chain([first], rows)
+    )
+    return sum(
+        accessible_row(above, row, below, full).bit_count()
+        for above, row, below in _windows(ints, 0)
+    )
+
+
+def _count_numpy(rows: Iterable[memoryview], threshold: int = DEFAULT_THRESHOLD) -> int:
+    """Count accessible rolls, holding three zero-padded uint8 rows."""
+
+    def as_array(row: memoryview) -> np.ndarray:
+        padded: np.ndarray = np.zeros(len(row) + 2, dtype=np.uint8)
+        padded[1:-1] = np.frombuffer(row, dtype=np.uint8) == ord("@")
+        return padded
+
+    total: int = 0
+    empty: np.ndarray = np.zeros(0, dtype=np.uint8)
+    for above, row, below in _windows(map(as_array, rows), empty):
+        column: np.ndarray = row.copy()
+        if above.size:
+            column += above
+        if below.size:
+            column += below
+
+        # 3-wide sum of the vertical sums, minus the cell itself
+        counts: np.ndarray = column[:-2] + column[1:-1] + column[2:] - row[1:-1]
+        total += int(np.count_nonzero(row[1:-1] & (counts < threshold)))
+    return total
+
+
+def count_accessible(
+    buffer: bytes,
+    *,
+    use_numpy: bool = True,
+) -> int:
+    """Stream buffer row by row and return the Part 1 count."""
+    rows: Iterator[memoryview] = iter_rows(buffer)
+    return _count_numpy(rows) if use_numpy else _count_bitboard(rows)
+
+
+def solve(input_path: str | Path, *, use_numpy: bool = True) -> int:
+    """Return Part 1 for the file at input_path in constant memory."""
+    with map_input(input_path) as buffer:
+        return count_accessible(buffer, use_numpy=use_numpy)
+
+
+def part1(data: list[str]) -> int:
+    return count_accessible("\n".join(data).encode())
+
+
+# =============================================================================
+# MAIN
+# =============================================================================
+if __name__ == "__main__":
+    import time
+    from pathlib import Path
+
+    for label, path in (
+        ("example", "src/aoc2025/solutions/day04/example.txt"),
+        ("real puzzle input", "src/aoc2025/solutions/day04/input.txt"),
+    ):
+        if not Path(path).exists():
+            print(f"\n({label.capitalize()} not found - skipping)")
+            continue
+
+        print(f"Testing with {label}:")
+        for use_numpy in (False, True):
+            start: float = time.perf_counter()
+            p1_answer: int = solve(path, use_numpy=use_numpy)
+            p1_time: float = time.perf_counter() - start
+
+            engine: str = "numpy" if use_numpy else "bitboard"
+            print(f"Part 1 ({engine:>8}): {p1_answer: 6} ({p1_time * 1000:7.3f}ms)")
@@ -4,9 +4,208 @@ Advent of Code 2025 - Day 4: Printing Department.
 Utility file for this day's solutions.
 """
 
+from __future__ import annotations
+
+import mmap
+from array import array
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+# 8 directions
+D8: list[tuple[int, int]] = [
+    (-1, -1),
+    (-1, 0),
+    (-1, 1),
+    (0, -1),
+    (0, 1),
+    (1, -1),
+    (1, 0),
+    (1, 1),
+]
+
+
+@dataclass(frozen=True)
+class Kernel:
+    """
+    A neighbourhood rule: the (dr, dc) offsets whose rolls count.
+
+    Each engine compiles the same kernel into its own form: flat index
+    offsets for the padded queue grid, shifted slices for the NumPy grid.
+    """
+
+    name: str
+    offsets: tuple[tuple[int, int], ...]
+
+    @property
+    def radius(self) -> int:
+        """How far the kernel reaches; also the sentinel border width."""
+        return max(max(abs(dr), abs(dc)) for dr, dc in self.offsets)
+
+    def flat_offsets(self, stride: int) -> tuple[int, ...]:
+        """Index deltas for a row-major grid whose rows are `stride` wide."""
+        return tuple(dr * stride + dc for dr, dc in self.offsets)
+
+
+MOORE = Kernel("moore", tuple(D8))
+# A roll is accessible with fewer than this many neighbouring rolls
+DEFAULT_THRESHOLD: int = 4
+VON_NEUMANN = Kernel("von_neumann", ((-1, 0), (0, -1), (0, 1), (1, 0)))
+MOORE_R2 = Kernel(
+    "moore_r2",
+    tuple((dr, dc) for dr in range(-2, 3) for dc in range(-2, 3) if (dr, dc) != (0, 0)),
+)
+
+# '@' -> 1, everything else -> 0
+ROLL_BYTES: bytes = bytes(1 if b == ord("@") else 0 for b in range(256))
 
 
 def parse(input_path: str | Path) -> list[str]:
     text: str = Path(input_path).read_text().strip()
     return text.splitlines()
+
+
+@contextmanager
+def map_input(input_path: str | Path) -> Iterator[mmap.mmap | bytes]:
+    """Memory-map the puzzle input read-only (empty files map to b"")."""
+    with Path(input_path).open("rb") as f:
+        if f.seek(0, 2) == 0:
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+
+def iter_rows(buffer: mmap.mmap | bytes) -> Iterator[memoryview]:
+    """
+    Yield every non-empty grid row of buffer as a zero-copy view.
+
+    A view is released when the caller asks for the next row, so callers
+    that keep a window of rows must convert each one before moving on.
+    """
+    end: int = len(buffer)
+    with memoryview(buffer) as view:
+        pos: int = 0
+        while pos < end:
+            newline: int = buffer.find(b"\n", pos)
+            stop: int = end if newline == -1 else newline
+
+            # Tolerate CRLF input and trailing whitespace without copying
+            line_end: int = stop
+            while line_end > pos and buffer[line_end - 1] in b" \t\r":
+                line_end -= 1
+
+            if line_end > pos:
+                with view[pos:line_end] as row:
+                    yield row
+            pos = stop + 1
+
+
+class PaddedGrid:
+    """
+    Flat roll grid surrounded by a sentinel border.
+
+    Cell (r, c) lives at flat index (r + pad) * stride + (c + pad), where
+    pad is the kernel radius and stride = w + 2 * pad. The border cells are
+    always empty, so every neighbour index `i + offset` is valid and no
+    bounds checks are needed.
+
+    Attributes:
+        cells: bytearray, 1 where a roll sits, 0 for empty and border
+        counts: array('B') of neighbouring-roll counts for every cell
+        offsets: flat index deltas for the kernel's neighbours
+
+    """
+
+    __slots__ = ("cells", "counts", "h", "offsets", "pad", "stride", "w")
+
+    def __init__(self, data: list[str], kernel: Kernel = MOORE) -> None:
+        rows: list[str] = [row.rstrip() for row in data]
+        self.h: int = len(rows)
+        self.w: int = len(rows[0])
+        self.pad: int = kernel.radius
+        self.stride: int = self.w + 2 * self.pad
+
+        self.cells: bytearray = bytearray(self.stride * (self.h + 2 * self.pad))
+        for r, row in enumerate(rows):
+            base: int = self.index(r, 0)
+            self.cells[base : base + self.w] = row.encode().translate(ROLL_BYTES)
+
+        self.offsets: tuple[int, ...] = kernel.flat_offsets(self.stride)
+
+        # Read the whole padded grid as one little-endian int, one byte per
+        # cell. Adding the shifted copies sums every cell's neighbours inside
+        # its own byte (at most 24 for radius 2, so no byte ever carries).
+        size: int = len(self.cells)
+        packed: int = int.from_bytes(self.cells, "little")
+        total: int = 0
+        for o in self.offsets:
+            total += packed >> (8 * o) if o > 0 else packed << (-8 * o)
+        total &= (1 << (8 * size)) - 1
+        self.counts: array = array("B", total.to_bytes(size, "little"))
+
+    def index(self, r: int, c: int) -> int:
+        """Flat index of grid cell (r, c)."""
+        return (r + self.pad) * self.stride + (c + self.pad)
+
+    def roll_indices(self) -> list[int]:
+        """Flat indices of every roll, in row-major order."""
+        cells: bytearray = self.cells
+        return [i for i in range(len(cells)) if cells[i]]
+
+    def accessible_indices(self, threshold: int = DEFAULT_THRESHOLD) -> list[int]:
+        """Flat indices of rolls with fewer than `threshold` neighbours."""
+        counts: array = self.counts
+        return [i for i in self.roll_indices() if counts[i] < threshold]
+
+    def peel(
+        self, threshold: int = DEFAULT_THRESHOLD, seed: Iterable[int] | None = None
+    ) -> int:
+        """
+        Count the rolls the Part 2 queue peel removes, leaving self intact.
+
+        Runs on copies of the cells and counts, so one grid can be peeled at
+        several thresholds. `seed` lists the initially accessible rolls when
+        the caller already knows them; otherwise they are found by a scan.
+        Queued cells stay rolls until popped, and an in-queue bitmap ensures
+        each roll is enqueued at most once.
+        """
+        cells: bytearray = self.cells[:]
+        counts: array = self.counts[:]
+        offsets: tuple[int, ...] = self.offsets
+
+        queued: bytearray = bytearray(len(cells))
+        q: deque[int] = deque(
+            self.accessible_indices(threshold) if seed is None else seed
+        )
+        for i in q:
+            queued[i] = 1
+
+        removed = 0
+        while q:
+            i: int = q.popleft()
+            cells[i] = 0
+            removed += 1
+
+            for o in offsets:
+                j: int = i + o
+                if cells[j]:
+                    counts[j] -= 1
+                    if counts[j] < threshold and not queued[j]:
+                        queued[j] = 1
+                        q.append(j)
+
+        return removed
+
+    def sweep(self, thresholds: Iterable[int]) -> dict[int, tuple[int, int]]:
+        """Return {threshold: (part1, part2)}, sharing one set of counts."""
+        results: dict[int, tuple[int, int]] = {}
+        for threshold in thresholds:
+            seed: list[int] = self.accessible_indices(threshold)
+            results[threshold] = (len(seed), self.peel(threshold, seed))
+        return results
@@ -0,0 +1,108 @@
+"""
+Advent of Code 2025 - Day 5: Cafeteria.
+
+Benchmark - slotted, in-place `elegant.Interval` vs the original dataclass.
+- `DictInterval` reproduces the previous `Interval`: a plain
+  `@dataclass(order=True)` whose `merge` allocates a new object.
+- The old parse-sort-merge pipeline is timed against `elegant.part2` on
+  synthetic range lists; wall time and the peak memory of the parsed
+  intervals are reported for each.
+"""
+
+import random
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from src.aoc2025.solutions.day05.elegant import Interval, part2
+
+# =============================================================================
+# BENCHMARK
+# =============================================================================
+
+
+@dataclass(order=True)
+class DictInterval:
+    """The original Interval: one __dict__ per object, merge allocates."""
+
+    lo: int
+    hi: int
+
+    def overlaps(self, other: "DictInterval") -> bool:
+        return self.lo <= other.hi + 1 and other.lo <= self.hi + 1
+
+    def merge(self, other: "DictInterval") -> "DictInterval":
+        return DictInterval(lo=min(self.lo, other.lo), hi=max(self.hi, other.hi))
+
+    def size(self) -> int:
+        return self.hi - self.lo + 1
+
+
+def random_ranges(n: int, seed: int = 0) -> list[str]:
+    """Return n "lo-hi" lines with enough overlap to exercise merging."""
+    rng: random.Random = random.Random(seed)
+    span: int = 10**15
+    lines: list[str] = []
+    for _ in range(n):
+        lo: int = rng.randrange(span)
+        lines.append(f"{lo}-{lo + rng.randrange(span // n * 4)}")
+    return lines
+
+
+def total_dict(lines: list[str]) -> int:
+    """Previous pipeline: replace the last interval on every overlap."""
+    merged: list[DictInterval] = []
+    for iv in sorted(DictInterval(*map(int, line.split("-"))) for line in lines):
+        if merged and merged[-1].overlaps(iv):
+            merged[-1] = merged[-1].merge(iv)
+        else:
+            merged.append(iv)
+    return sum(iv.size() for iv in merged)
+
+
+def total_slotted(lines: list[str]) -> int:
+    """Current pipeline: `elegant.part2` (key sort, in-place merge)."""
+    return part2([*lines, ""])
+
+
+def peak_bytes(cls: type, lines: list[str]) -> int:
+    """Peak traced memory while parsing every line into a `cls` instance."""
+    tracemalloc.start()
+    intervals: list = [cls(*map(int, line.split("-"))) for line in lines]
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del intervals
+    return peak
+
+
+def time_best(fn: Callable[[list[str]], int], lines: list[str], runs: int) -> float:
+    """Best wall time of `runs` calls, in seconds."""
+    best: float = float("inf")
+    for _ in range(runs):
+        start: float = time.perf_counter()
+        fn(lines)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+# =============================================================================
+# MAIN
+# =============================================================================
+if __name__ == "__main__":
+    runs: int = 3
+
+    for n in (10**4, 10**5, 10**6):
+        lines: list[str] = random_ranges(n)
+        assert total_dict(lines) == total_slotted(lines)
+
+        print(f"\n{n:,} ranges")
+        for label, cls, fn in (
+            ("dataclass", DictInterval, total_dict),
+            ("slotted", Interval, total_slotted),
+        ):
+            elapsed: float = time_best(fn, lines, runs)
+            peak: int = peak_bytes(cls, lines)
+            print(
+                f"  {label:10} {elapsed * 1000:9.1f}ms  {peak / 2**20:8.1f} MiB parsed",
+            )
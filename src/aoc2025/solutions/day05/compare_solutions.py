@@ -88,7 +88,15 @@ def compare_solutions(
 
     """
     if solutions is None:
-        solutions = ["initial", "basic", "optimized", "elegant"]
+        solutions = [
+            "initial",
+            "basic",
+            "optimized",
+            "elegant",
+            "vectorized",
+            "dynamic",
+            "indexed",
+        ]
 
     results: list[SolutionResult] = []
 
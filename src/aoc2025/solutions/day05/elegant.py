@@ -2,19 +2,20 @@
 Advent of Code 2025 - Day 5: Cafeteria.
 
 Elegant / Pythonic solution:
-- Interval abstraction using @dataclass
+- Interval abstraction using a slotted @dataclass (no per-object __dict__)
 - Clean overlap/merge semantics
 - Clear functional merging pipeline
 """
 
 from dataclasses import dataclass
+from operator import attrgetter
 
 # =============================================================================
 # SOLUTION 4: ALTERNATIVE / ELEGANT
 # =============================================================================
 
 
-@dataclass(order=True)
+@dataclass(order=True, slots=True)
 class Interval:
     """Represents an inclusive integer interval [lo, hi]."""
 
@@ -35,17 +36,21 @@ class Interval:
         return self.lo <= other.hi + 1 and other.lo <= self.hi + 1
 
     def merge(self, other: "Interval") -> "Interval":
-        """Return the minimal interval covering both intervals."""
-        return Interval(
-            lo=min(self.lo, other.lo),
-            hi=max(self.hi, other.hi),
-        )
+        """Grow this interval in place to cover both; return it."""
+        self.lo = min(self.lo, other.lo)
+        self.hi = max(self.hi, other.hi)
+        return self
 
     def size(self) -> int:
         """Return the number of integers contained in this interval."""
         return self.hi - self.lo + 1
 
 
+# Sort key for intervals. The order=True comparisons build a tuple per
+# comparison in Python; a C-level key is several times faster to sort by.
+BY_BOUNDS = attrgetter("lo", "hi")
+
+
 def _parse_intervals(data: list[str]) -> list[Interval]:
     """Extract interval objects from the first section of the input."""
     blank: int = data.index("")
@@ -64,7 +69,7 @@ def part1(data: list[str]) -> int:
 
     """
     blank: int = data.index("")
-    intervals: list[Interval] = sorted(_parse_intervals(data))
+    intervals: list[Interval] = sorted(_parse_intervals(data), key=BY_BOUNDS)
 
     available_ids: map[int] = map(int, data[blank + 1 :])
 
@@ -93,7 +98,7 @@ def part2(data: list[str]) -> int:
         Count of all integers represented by the merged intervals.
 
     """
-    intervals: list[Interval] = sorted(_parse_intervals(data))
+    intervals: list[Interval] = sorted(_parse_intervals(data), key=BY_BOUNDS)
 
     merged: list[Interval] = []
 
@@ -106,8 +111,8 @@ def part2(data: list[str]) -> int:
         last: Interval = merged[-1]
 
         if last.overlaps(iv):
-            # Replace last with the merged interval.
-            merged[-1] = last.merge(iv)
+            # Extend last in place; no new object per overlap.
+            last.merge(iv)
         else:
             # Disjoint interval — append separately.
             merged.append(iv)
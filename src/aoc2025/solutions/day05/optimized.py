@@ -4,9 +4,11 @@ Advent of Code 2025 - Day 5: Cafeteria.
 Optimized solution:
 - Minimizes redundant comparisons
 - Efficient interval merging
-- Early-stopping membership check
+- Binary-search membership check against the merged ranges
 """
 
+from bisect import bisect_right
+
 # =============================================================================
 # SOLUTION 3: OPTIMIZED / EFFICIENT
 # =============================================================================
@@ -36,39 +38,88 @@ def _parse_ranges_and_ids(data: list[str]) -> tuple[list[tuple[int, int]], list[
     return ranges, available
 
 
-def part1(data: list[str]) -> int:
+def merge_ranges(ranges: list[tuple[int, int]]) -> list[tuple[int, int]]:
     """
-    Optimized membership check using sorted ranges and early stopping.
+    Merge overlapping or adjacent ranges with one sweep over them in order.
 
     Args:
-        data: Raw puzzle input.
+        ranges: Inclusive (lo, hi) pairs, in any order.
 
     Returns:
-        Count of fresh available ingredient IDs.
+        Disjoint, non-adjacent (lo, hi) pairs sorted by lo.
 
     """
-    ranges, available = _parse_ranges_and_ids(data)
+    if not ranges:
+        return []
+
+    # Sort ranges by their starting value.
+    ordered: list[tuple[int, int]] = sorted(ranges)
+
+    # Initialize with the first interval.
+    merged_lo, merged_hi = ordered[0]
+    merged: list[tuple[int, int]] = []
+
+    # Sweep all remaining intervals.
+    for lo, hi in ordered[1:]:
+        # If overlapping or adjacent, merge into the running interval.
+        if lo <= merged_hi + 1:
+            merged_hi = max(merged_hi, hi)
+        else:
+            # If disjoint, finalize the previous interval.
+            merged.append((merged_lo, merged_hi))
 
-    # Sort ranges upfront. This allows early stopping when lo > x.
-    ranges.sort()
+            # Start a new merge window.
+            merged_lo, merged_hi = lo, hi
+
+    # Keep the final interval.
+    merged.append((merged_lo, merged_hi))
+
+    return merged
+
+
+def count_fresh(merged: list[tuple[int, int]], available: list[int]) -> int:
+    """
+    Count the IDs that fall inside any of the merged ranges.
+
+    The only range that can hold an ID is the last one starting at or
+    before it, which `bisect_right` finds in O(log n).
+
+    Args:
+        merged: Output of `merge_ranges`.
+        available: Ingredient IDs to classify.
+
+    Returns:
+        Count of IDs inside a range.
+
+    """
+    starts: list[int] = [lo for lo, _ in merged]
+    ends: list[int] = [hi for _, hi in merged]
 
     fresh_count: int = 0
 
     for ingredient_id in available:
-        for lo, hi in ranges:
-            # If the current range begins past the ingredient,
-            # no later range can possibly contain it.
-            if lo > ingredient_id:
-                break
-
-            # Fresh if inside this interval.
-            if lo <= ingredient_id <= hi:
-                fresh_count += 1
-                break
+        k: int = bisect_right(starts, ingredient_id) - 1
+        if k >= 0 and ingredient_id <= ends[k]:
+            fresh_count += 1
 
     return fresh_count
 
 
+def part1(data: list[str]) -> int:
+    """
+    Merge the ranges once, then binary-search each ingredient ID.
+
+    Args:
+        data: Raw puzzle input.
+
+    Returns:
+        Count of fresh available ingredient IDs.
+
+    """
+    ranges, available = _parse_ranges_and_ids(data)
+    return count_fresh(merge_ranges(ranges), available)
+
+
 def part2(data: list[str]) -> int:
     """
     Optimized interval merging to compute total fresh ID count.
@@ -85,29 +136,7 @@ def part2(data: list[str]) -> int:
         tuple(map(int, line.split("-"))) for line in data[:blank]
     ]
 
-    # Sort ranges by their starting value.
-    ranges.sort()
-
-    # Initialize with the first interval.
-    merged_lo, merged_hi = ranges[0]
-    total_ids = 0
-
-    # Sweep all remaining intervals.
-    for lo, hi in ranges[1:]:
-        # If overlapping or adjacent, merge into the running interval.
-        if lo <= merged_hi + 1:
-            merged_hi: int = max(merged_hi, hi)
-        else:
-            # If disjoint, finalize the previous interval.
-            total_ids += merged_hi - merged_lo + 1
-
-            # Start a new merge window.
-            merged_lo, merged_hi = lo, hi
-
-    # Count final interval.
-    total_ids += merged_hi - merged_lo + 1
-
-    return total_ids
+    return sum(hi - lo + 1 for lo, hi in merge_ranges(ranges))
 
 
 # =============================================================================
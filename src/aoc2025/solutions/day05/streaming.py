@@ -0,0 +1,122 @@
+"""
+Advent of Code 2025 - Day 5: Cafeteria.
+
+Streaming Solution - the ID section is never held in memory.
+- The range section is read line by line and merged with
+  `optimized.merge_ranges`.
+- The ID section is then read in fixed-size byte chunks. A chunk is cut at
+  its last newline (the tail carries over to the next chunk), its IDs are
+  parsed straight from the bytes and counted with `optimized.count_fresh`.
+- After every chunk the running (IDs seen, fresh) counts are yielded, so a
+  long job reports progress as it goes.
+- Memory is bounded by the range index plus one chunk, whatever the number
+  of IDs.
+"""
+
+from __future__ import annotations
+
+import io
+from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO
+
+from src.aoc2025.solutions.day05.optimized import count_fresh, merge_ranges
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+# =============================================================================
+# SOLUTION 8: STREAMING / CHUNKED
+# =============================================================================
+
+CHUNK_SIZE: int = 1 << 20
+
+
+def read_ranges(f: BinaryIO) -> list[tuple[int, int]]:
+    """Read range lines up to the blank separator; return them merged."""
+    ranges: list[tuple[int, int]] = []
+    for line in f:
+        line = line.strip()
+        if not line:
+            break
+        lo, hi = line.split(b"-")
+        ranges.append((int(lo), int(hi)))
+    return merge_ranges(ranges)
+
+
+def iter_id_chunks(f: BinaryIO, chunk_size: int = CHUNK_SIZE) -> Iterator[list[int]]:
+    """Yield the remaining IDs in f, one list per chunk read."""
+    carry: bytes = b""
+    while chunk := f.read(chunk_size):
+        chunk = carry + chunk
+        # The bytes after the last newline may be half an ID
+        cut: int = chunk.rfind(b"\n") + 1
+        carry = chunk[cut:]
+        if cut:
+            yield [int(token) for token in chunk[:cut].split()]
+    if carry.strip():
+        yield [int(token) for token in carry.split()]
+
+
+def check_stream(
+    f: BinaryIO,
+    chunk_size: int = CHUNK_SIZE,
+) -> Iterator[tuple[int, int]]:
+    """
+    Classify every ID in a puzzle input stream, chunk by chunk.
+
+    Args:
+        f: Binary stream positioned at the start of the puzzle input.
+        chunk_size: Bytes read from the ID section at a time.
+
+    Yields:
+        Running (IDs seen, fresh IDs) totals after each chunk.
+
+    """
+    merged: list[tuple[int, int]] = read_ranges(f)
+
+    seen: int = 0
+    fresh_count: int = 0
+    for ids in iter_id_chunks(f, chunk_size):
+        fresh_count += count_fresh(merged, ids)
+        seen += len(ids)
+        yield seen, fresh_count
+
+
+def solve(input_path: str | Path, chunk_size: int = CHUNK_SIZE) -> int:
+    """Return the Part 1 answer, streaming the input from disk."""
+    fresh_count: int = 0
+    with Path(input_path).open("rb") as f:
+        for _, fresh_count in check_stream(f, chunk_size):
+            pass
+    return fresh_count
+
+
+def part1(data: list[str]) -> int:
+    fresh_count: int = 0
+    for _, fresh_count in check_stream(io.BytesIO("\n".join(data).encode())):
+        pass
+    return fresh_count
+
+
+# =============================================================================
+# MAIN
+# =============================================================================
+if __name__ == "__main__":
+    import time
+
+    for label, path in (
+        ("example", "src/aoc2025/solutions/day05/example.txt"),
+        ("real puzzle input", "src/aoc2025/solutions/day05/input.txt"),
+    ):
+        if not Path(path).exists():
+            print(f"\n({label.capitalize()} not found - skipping)")
+            continue
+
+        print(f"Testing with {label}:")
+        start: float = time.perf_counter()
+        with Path(path).open("rb") as f:
+            for seen, fresh in check_stream(f):
+                print(f"  {seen:12} IDs checked, {fresh:12} fresh")
+        p1_time: float = time.perf_counter() - start
+
+        print(f"Part 1: {fresh:6} ({p1_time * 1000:7.3f}ms)")
@@ -5,6 +5,7 @@ Basic / Straightforward solution:
 - Literal, clear parsing with minimal cleverness.
 """
 
+from src.aoc2025.solutions.day06.utils import multiply
 
 # =============================================================================
 # SOLUTION 2: BASIC / STRAIGHTFORWARD
@@ -16,14 +17,6 @@ def safe_int(value: str) -> int:
     return int(value.strip()) if value.strip() else 0
 
 
-def multiply(values: list[int]) -> int:
-    """Multiply a list of integers."""
-    result = 1
-    for v in values:
-        result *= v
-    return result
-
-
 def part1(data: list[str]) -> int:
     """
     Evaluate each column as its own arithmetic problem.
@@ -0,0 +1,85 @@
+"""
+Advent of Code 2025 - Day 6: Trash Compactor.
+
+Benchmark - product-tree `utils.multiply` vs the left-to-right loop.
+- Synthetic worksheets hold a handful of '*' problems whose columns carry
+  thousands of multi-digit factors, the case where the loop goes quadratic.
+- Both multiplications are timed on the factor lists Part 1 reads from each
+  worksheet, and the end-to-end `optimized.part1` time is reported too.
+"""
+
+import random
+import time
+from collections.abc import Callable
+
+from src.aoc2025.solutions.day06.optimized import part1
+from src.aoc2025.solutions.day06.utils import multiply
+
+# =============================================================================
+# BENCHMARK
+# =============================================================================
+
+
+def multiply_linear(values: list[int]) -> int:
+    """The previous `multiply`: one factor at a time."""
+    result = 1
+    for v in values:
+        result *= v
+    return result
+
+
+def random_worksheet(rows: int, problems: int, digits: int, seed: int = 0) -> list[str]:
+    """Return a worksheet of `problems` '*' columns, each `rows` factors tall."""
+    rng: random.Random = random.Random(seed)
+    lo: int = 10 ** (digits - 1)
+    hi: int = 10**digits - 1
+    grid: list[str] = [
+        " ".join(str(rng.randint(lo, hi)) for _ in range(problems)) for _ in range(rows)
+    ]
+    grid.append(" ".join("*".ljust(digits) for _ in range(problems)))
+    return grid
+
+
+def factor_lists(data: list[str]) -> list[list[int]]:
+    """Return the factors of every problem, read the Part 1 way."""
+    rows: list[list[str]] = [row.split() for row in data[:-1]]
+    return [[int(row[c]) for row in rows] for c in range(len(rows[0]))]
+
+
+def multiply_all(
+    mul: Callable[[list[int]], int], factors: list[list[int]]
+) -> list[int]:
+    """Apply one multiplication strategy to every problem."""
+    return [mul(f) for f in factors]
+
+
+def time_best(fn: Callable[..., object], *args: object, runs: int) -> float:
+    """Best wall time of `runs` calls of fn(*args), in seconds."""
+    best: float = float("inf")
+    for _ in range(runs):
+        start: float = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+# =============================================================================
+# MAIN
+# =============================================================================
+if __name__ == "__main__":
+    runs: int = 3
+    problems: int = 4
+
+    for rows, digits in ((1_000, 4), (5_000, 4), (20_000, 6)):
+        data: list[str] = random_worksheet(rows, problems, digits)
+        factors: list[list[int]] = factor_lists(data)
+        assert all(multiply(f) == multiply_linear(f) for f in factors)
+
+        linear: float = time_best(multiply_all, multiply_linear, factors, runs=runs)
+        tree: float = time_best(multiply_all, multiply, factors, runs=runs)
+        end_to_end: float = time_best(part1, data, runs=runs)
+
+        print(f"\n{problems} problems x {rows:,} factors of {digits} digits")
+        print(f"  loop multiply   {linear * 1000:10.1f}ms")
+        print(f"  product tree    {tree * 1000:10.1f}ms")
+        print(f"  optimized.part1 {end_to_end * 1000:10.1f}ms")
@@ -23,6 +23,7 @@ class SolutionResult:
     part1_time: float | None
     part2_answer: int | None
     part2_time: float | None
+    both_time: float | None = None
     error: str | None = None
 
     def __str__(self) -> str:
@@ -45,11 +46,17 @@ class SolutionResult:
             if self.part2_time is not None
             else "    N/A"
         )
+        both_time_str: str = (
+            f"{self.both_time * 1000:7.3f}ms"
+            if self.both_time is not None
+            else "    N/A"
+        )
 
         return (
             f"{self.name:20} | "
             f"Part 1: {p1_str} ({p1_time_str}) | "
-            f"Part 2: {p2_str} ({p2_time_str})"
+            f"Part 2: {p2_str} ({p2_time_str}) | "
+            f"Both: {both_time_str}"
         )
 
 
@@ -88,7 +95,14 @@ def compare_solutions(
 
     """
     if solutions is None:
-        solutions = ["initial", "basic", "optimized", "elegant"]
+        solutions = [
+            "initial",
+            "basic",
+            "optimized",
+            "elegant",
+            "vectorized",
+            "unified",
+        ]
 
     results: list[SolutionResult] = []
 
@@ -109,6 +123,19 @@ def compare_solutions(
                 p2_answer = module.part2(data)
             p2_time: float = (time.perf_counter() - start) / runs
 
+            # Time both parts together: one `solve` call where a solution
+            # answers both in one pass, otherwise part1 + part2
+            both_time: float = p1_time + p2_time
+            error: str | None = None
+            if hasattr(module, "solve"):
+                start = time.perf_counter()
+                for _ in range(runs):
+                    both_answers = module.solve(data)
+                both_time = (time.perf_counter() - start) / runs
+
+                if both_answers != (p1_answer, p2_answer):
+                    error = f"solve() returned {both_answers}, parts disagree"
+
             results.append(
                 SolutionResult(
                     name=solution_name.capitalize(),
@@ -116,6 +143,8 @@ def compare_solutions(
                     part1_time=p1_time,
                     part2_answer=p2_answer,
                     part2_time=p2_time,
+                    both_time=both_time,
+                    error=error,
                 ),
             )
         except (ImportError, AttributeError) as e:
@@ -136,7 +165,7 @@ def compare_solutions(
 
 def print_comparison(results: list[SolutionResult]) -> None:
     """Pretty print the comparison results."""
-    line_length = 90
+    line_length = 110
     print("\n" + "=" * line_length)
     print("SOLUTION COMPARISON")
     print("=" * line_length)
@@ -171,8 +200,11 @@ def print_comparison(results: list[SolutionResult]) -> None:
         fastest_p1: SolutionResult = min(valid_results, key=lambda r: r.part1_time)
         fastest_p2: SolutionResult = min(valid_results, key=lambda r: r.part2_time)
 
+        fastest_both: SolutionResult = min(valid_results, key=lambda r: r.both_time)
+
         print(f"\n🏆 Fastest Part 1: {fastest_p1.name}")
         print(f"🏆 Fastest Part 2: {fastest_p2.name}")
+        print(f"🏆 Fastest Both:   {fastest_both.name}")
 
 
 # =============================================================================
@@ -187,6 +219,32 @@ if __name__ == "__main__":
     results: list[SolutionResult] = compare_solutions(example, runs=1000)
     print_comparison(results)
 
+    # Example with rows 0 and 1 swapped: parse() strips the new first row's
+    # leading space, so its columns no longer line up from the left.
+    # 'initial' pads to the first row's width and is left out here.
+    lines: list[str] = (
+        Path("src/aoc2025/solutions/day06/example.txt").read_text().splitlines()
+    )
+    lines[0], lines[1] = lines[1], lines[0]
+    shifted: list[str] = "\n".join(lines).strip().splitlines()
+    print("\n\nTesting with example data, first row indented:")
+    results = compare_solutions(
+        shifted,
+        ["basic", "optimized", "elegant", "vectorized", "unified"],
+        runs=1000,
+    )
+    print_comparison(results)
+    assert all(
+        (r.part1_answer, r.part2_answer) == (4277556, 19495075) for r in results
+    ), "shifted example"
+
+    # streaming.solve takes a path; check its list-based parts directly
+    streaming: ModuleType = load_solution("streaming")
+    assert (streaming.part1(shifted), streaming.part2(shifted)) == (
+        4277556,
+        19495075,
+    ), "shifted example (streaming)"
+
     # Real data
     try:
         data: list[str] = parse("src/aoc2025/solutions/day06/input.txt")
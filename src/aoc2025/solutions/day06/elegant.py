@@ -13,12 +13,7 @@ while preserving your exact puzzle logic.
 
 from dataclasses import dataclass
 
-
-def multiply(values: list[int]) -> int:
-    result = 1
-    for v in values:
-        result *= v
-    return result
+from src.aoc2025.solutions.day06.utils import multiply
 
 
 @dataclass
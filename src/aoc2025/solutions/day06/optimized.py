@@ -12,17 +12,12 @@ faster splitting, and reduced branching inside loops.
 
 from typing import TYPE_CHECKING
 
+from src.aoc2025.solutions.day06.utils import multiply
+
 if TYPE_CHECKING:
     from collections.abc import Generator
 
 
-def multiply(values: list[int]) -> int:
-    result = 1
-    for v in values:
-        result *= v
-    return result
-
-
 def part1(data: list[str]) -> int:
     """Optimized evaluation of column-wise problems."""
     if not data:
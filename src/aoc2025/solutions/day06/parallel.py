@@ -0,0 +1,124 @@
+"""
+Advent of Code 2025 - Day 6: Trash Compactor.
+
+Parallel solution - blocks farmed out to a process pool:
+- A cheap pre-scan in the parent finds every block's column range with the
+  `streaming` window walk; no number is parsed yet.
+- Consecutive blocks are grouped into tasks of roughly equal width, a few
+  per worker, so one wide block does not leave the other workers idle.
+- Workers receive only the path, the row offsets and their column ranges,
+  memory-map the worksheet themselves and evaluate both parts; the
+  parent sums the partial totals.
+- Small worksheets skip the pool entirely; process start-up would dominate.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from src.aoc2025.solutions.day06.streaming import (
+    evaluate_blocks,
+    iter_blocks,
+    solve_buffer,
+)
+from src.aoc2025.solutions.day06.utils import map_input, row_spans
+
+# =============================================================================
+# SOLUTION 8: PARALLEL / PROCESS POOL
+# =============================================================================
+
+# Below this size a single streaming pass beats spinning up workers.
+MIN_PARALLEL_BYTES: int = 1 << 20
+# Tasks per worker, so uneven blocks still spread across the pool.
+TASKS_PER_WORKER: int = 4
+
+
+def group_blocks(
+    blocks: list[tuple[int, int]],
+    tasks: int,
+) -> list[list[tuple[int, int]]]:
+    """Split blocks into at most `tasks` consecutive runs of similar width."""
+    total: int = sum(c1 - c0 for c0, c1 in blocks)
+    target: float = total / tasks
+
+    groups: list[list[tuple[int, int]]] = [[]]
+    width: int = 0
+    for block in blocks:
+        if width >= target and len(groups) < tasks:
+            groups.append([])
+            width = 0
+        groups[-1].append(block)
+        width += block[1] - block[0]
+
+    return [group for group in groups if group]
+
+
+def _solve_task(
+    task: tuple[str, list[tuple[int, int]], list[tuple[int, int]]],
+) -> tuple[int, int]:
+    """Worker entry point: map the file and evaluate one group of blocks."""
+    input_path, spans, blocks = task
+    with map_input(input_path) as buffer:
+        return evaluate_blocks(buffer, spans, blocks)
+
+
+def solve(
+    input_path: str | Path,
+    workers: int | None = None,
+    min_parallel_bytes: int = MIN_PARALLEL_BYTES,
+) -> tuple[int, int]:
+    """
+    Return (part1, part2), evaluating groups of blocks on a process pool.
+
+    Args:
+        input_path: Puzzle input file
+        workers: Number of worker processes (defaults to os.cpu_count())
+        min_parallel_bytes: Inputs smaller than this run in-process
+
+    """
+    workers = workers or os.cpu_count() or 1
+
+    with map_input(input_path) as buffer:
+        if workers == 1 or len(buffer) < min_parallel_bytes:
+            return solve_buffer(buffer)
+
+        spans: list[tuple[int, int]] = row_spans(buffer)
+        blocks: list[tuple[int, int]] = list(iter_blocks(buffer, spans))
+
+    path: str = str(input_path)
+    groups: list[list[tuple[int, int]]] = group_blocks(
+        blocks, workers * TASKS_PER_WORKER
+    )
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        partials = pool.map(_solve_task, [(path, spans, group) for group in groups])
+        total1: int = 0
+        total2: int = 0
+        for p1, p2 in partials:
+            total1 += p1
+            total2 += p2
+
+    return total1, total2
+
+
+# =============================================================================
+# MAIN
+# =============================================================================
+if __name__ == "__main__":
+    import time
+
+    for label, path in (
+        ("example", "src/aoc2025/solutions/day06/example.txt"),
+        ("real puzzle input", "src/aoc2025/solutions/day06/input.txt"),
+    ):
+        if not Path(path).exists():
+            print(f"\n({label.capitalize()} not found - skipping)")
+            continue
+
+        print(f"Testing with {label}:")
+        start: float = time.perf_counter()
+        p1_answer, p2_answer = solve(path)
+        both_time: float = time.perf_counter() - start
+
+        print(f"Part 1: {p1_answer}")
+        print(f"Part 2: {p2_answer}")
+        print(f"Both parts, parallel: ({both_time * 1000:7.3f}ms)")
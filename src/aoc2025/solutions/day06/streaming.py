@@ -0,0 +1,156 @@
+"""
+Advent of Code 2025 - Day 6: Trash Compactor.
+
+Streaming solution - for worksheets millions of columns wide:
+- The file is memory-mapped and only the byte offsets of each row are
+  recorded; rows are never reversed, padded or copied whole.
+- Columns are walked from the right in fixed-size windows. Each window's
+  blank columns come from the same used-byte mask `unified` builds, taken
+  over that window's slice of every row.
+- A block is evaluated with `unified.evaluate_block` the moment its left
+  edge is found, so memory is bounded by the window and the largest block,
+  not by the worksheet width.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from src.aoc2025.solutions.day06.unified import BLOCK, USED_BYTES, evaluate_block
+from src.aoc2025.solutions.day06.utils import align_rows, map_input, row_spans
+
+if TYPE_CHECKING:
+    import mmap
+    from collections.abc import Iterable, Iterator
+
+# =============================================================================
+# SOLUTION 7: STREAMING / MEMORY-MAPPED
+# =============================================================================
+
+WINDOW: int = 1 << 16
+
+
+def iter_blocks(
+    buffer: mmap.mmap | bytes,
+    spans: list[tuple[int, int]],
+    window: int = WINDOW,
+) -> Iterator[tuple[int, int]]:
+    """
+    Yield the [c0, c1) column range of every block, rightmost block first.
+
+    Args:
+        buffer: The whole worksheet.
+        spans: Row offsets from `row_spans`; shorter rows count as padded.
+        window: Columns examined per step.
+
+    """
+    w: int = max(end - start for start, end in spans)
+    # Right edge of a block whose left edge lies further left, if any
+    open_end: int | None = None
+
+    hi: int = w
+    while hi > 0:
+        lo: int = max(hi - window, 0)
+        used: int = 0
+        for start, end in spans:
+            chunk: bytes = buffer[min(start + lo, end) : min(start + hi, end)]
+            used |= int.from_bytes(chunk.translate(USED_BYTES).ljust(hi - lo, b"\0"))
+        mask: bytes = used.to_bytes(hi - lo)
+
+        for m in reversed(list(BLOCK.finditer(mask))):
+            c0, c1 = lo + m.start(), lo + m.end()
+            if open_end is not None and c1 < hi:
+                # A blank column at hi - 1 closed the open block at hi
+                yield hi, open_end
+                open_end = None
+            if open_end is None:
+                open_end = c1
+            if c0 > lo or lo == 0:
+                yield c0, open_end
+                open_end = None
+            hi = c0  # later runs in this window all lie left of c0
+
+        if open_end is not None and hi > lo:
+            # The open block's left edge was hi; column hi - 1 is blank
+            yield hi, open_end
+            open_end = None
+        hi = lo
+
+
+def evaluate_blocks(
+    buffer: mmap.mmap | bytes,
+    spans: list[tuple[int, int]],
+    blocks: Iterable[tuple[int, int]],
+) -> tuple[int, int]:
+    """Return the summed (part1, part2) values of the given column blocks."""
+    *digit_spans, (op_start, op_end) = spans
+
+    total1 = 0
+    total2 = 0
+    for c0, c1 in blocks:
+        width: int = c1 - c0
+        cells: list[bytes] = [
+            buffer[min(start + c0, end) : min(start + c1, end)].ljust(width)
+            for start, end in digit_spans
+        ]
+        ops: bytes = buffer[min(op_start + c0, op_end) : min(op_start + c1, op_end)]
+
+        v1, v2 = evaluate_block(cells, ops)
+        total1 += v1
+        total2 += v2
+
+    return total1, total2
+
+
+def solve_buffer(buffer: mmap.mmap | bytes, window: int = WINDOW) -> tuple[int, int]:
+    """Return (part1, part2), evaluating each block as soon as it closes."""
+    spans: list[tuple[int, int]] = row_spans(buffer)
+    if not spans:
+        return 0, 0
+    return evaluate_blocks(buffer, spans, iter_blocks(buffer, spans, window))
+
+
+def solve(input_path: str | Path, window: int = WINDOW) -> tuple[int, int]:
+    """Return (part1, part2) streaming over the memory-mapped worksheet."""
+    with map_input(input_path) as buffer:
+        return solve_buffer(buffer, window)
+
+
+def solve_rows(data: list[str]) -> tuple[int, int]:
+    """Return (part1, part2) for parsed rows, re-aligned into one buffer."""
+    if not data:
+        return 0, 0
+    return solve_buffer("\n".join(align_rows(data)).encode())
+
+
+def part1(data: list[str]) -> int:
+    return solve_rows(data)[0]
+
+
+def part2(data: list[str]) -> int:
+    return solve_rows(data)[1]
+
+
+# =============================================================================
+# MAIN
+# =============================================================================
+if __name__ == "__main__":
+    import time
+
+    for label, path in (
+        ("example", "src/aoc2025/solutions/day06/example.txt"),
+        ("real puzzle input", "src/aoc2025/solutions/day06/input.txt"),
+    ):
+        if not Path(path).exists():
+            print(f"\n({label.capitalize()} not found - skipping)")
+            continue
+
+        print(f"Testing with {label}:")
+        start: float = time.perf_counter()
+        p1_answer, p2_answer = solve(path)
+        both_time: float = time.perf_counter() - start
+
+        print(f"Part 1: {p1_answer}")
+        print(f"Part 2: {p2_answer}")
+        print(f"Both parts, one pass: ({both_time * 1000:7.3f}ms)")
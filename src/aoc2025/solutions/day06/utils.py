@@ -4,10 +4,97 @@ Advent of Code 2025 - Day 5: Cafeteria.
 Utility file for this day's solutions.
 """
 
+from __future__ import annotations
+
+import math
+import mmap
+from contextlib import contextmanager
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+# Up to this many factors, a flat math.prod beats building a tree
+PRODUCT_TREE_MIN: int = 64
+# Factors multiplied flat at each leaf of the tree
+PRODUCT_TREE_LEAF: int = 32
 
 
 def parse(input_path: str | Path) -> list[str]:
     """Parse input file into list of rotation instructions."""
     text: str = Path(input_path).read_text().strip()
     return text.splitlines()
+
+
+def align_rows(data: list[str]) -> list[str]:
+    """
+    Return the parsed rows padded to one width with their columns lined up.
+
+    `parse` strips the whole file, so the first row loses its leading
+    spaces: it is right-aligned back to full width. Every other row keeps
+    its leading spaces and is padded on the right.
+    """
+    w: int = max(len(line) for line in data)
+    return [data[0].rjust(w), *(line.ljust(w) for line in data[1:])]
+
+
+@contextmanager
+def map_input(input_path: str | Path) -> Iterator[mmap.mmap | bytes]:
+    """Memory-map the puzzle input read-only (empty files map to b"")."""
+    with Path(input_path).open("rb") as f:
+        if f.seek(0, 2) == 0:
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+
+def row_spans(buffer: mmap.mmap | bytes) -> list[tuple[int, int]]:
+    """
+    Return the (start, end) byte offsets of every worksheet row in buffer.
+
+    Line endings (LF or CRLF) are excluded, and trailing blank lines are
+    dropped. Leading spaces are kept: they are column positions.
+    """
+    spans: list[tuple[int, int]] = []
+    start: int = 0
+    size: int = len(buffer)
+    while start < size:
+        nl: int = buffer.find(b"\n", start)
+        end: int = size if nl == -1 else nl
+        stop: int = end - 1 if end > start and buffer[end - 1] == ord("\r") else end
+        spans.append((start, stop))
+        start = end + 1
+
+    while spans and not buffer[spans[-1][0] : spans[-1][1]].strip():
+        spans.pop()
+    return spans
+
+
+def multiply(values: list[int]) -> int:
+    """
+    Multiply a list of integers with a balanced product tree.
+
+    A left-to-right product grows one small factor at a time, so every step
+    re-copies an ever larger big int: quadratic in the total digit count.
+    Multiplying neighbours pairwise keeps the operands balanced, letting
+    Python's Karatsuba multiplication do the heavy lifting. Short lists
+    take the `math.prod` fast path.
+    """
+    if len(values) <= PRODUCT_TREE_MIN:
+        return math.prod(values)
+
+    level: list[int] = [
+        math.prod(values[i : i + PRODUCT_TREE_LEAF])
+        for i in range(0, len(values), PRODUCT_TREE_LEAF)
+    ]
+    while len(level) > 1:
+        paired: list[int] = [
+            level[i] * level[i + 1] for i in range(0, len(level) - 1, 2)
+        ]
+        if len(level) % 2:
+            paired.append(level[-1])
+        level = paired
+
+    return level[0]
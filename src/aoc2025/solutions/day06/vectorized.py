@@ -0,0 +1,174 @@
+"""
+Advent of Code 2025 - Day 6: Trash Compactor.
+
+Vectorized / NumPy solution:
+- The worksheet is loaded once as a space-padded 2-D uint8 array, with the
+  first row re-aligned by `utils.align_rows`; rows are never reversed (sums
+  and products do not depend on the reading order).
+- Problem blocks are found with one vectorized "all-space column" mask.
+- Part 2's column numbers are built for the whole worksheet at once by
+  walking the transposed digit rows; Part 1 reads each block's row slices.
+- Only the final (possibly huge) sums and products run as Python ints.
+"""
+
+# =============================================================================
+# SOLUTION 5: VECTORIZED / NUMPY
+# =============================================================================
+
+import numpy as np
+
+from src.aoc2025.solutions.day06.utils import align_rows, multiply
+
+SPACE: int = ord(" ")
+ZERO: int = ord("0")
+PLUS: int = ord("+")
+
+# Column numbers with more digits than this could overflow int64
+MAX_INT64_DIGITS: int = 18
+
+
+def to_array(data: list[str]) -> np.ndarray:
+    """Return the worksheet as an (h, w) uint8 array padded with spaces."""
+    rows: list[str] = align_rows(data)
+    padded: bytes = "".join(rows).encode()
+    return np.frombuffer(padded, dtype=np.uint8).reshape(len(rows), len(rows[0]))
+
+
+def block_bounds(grid: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Return the starts and (exclusive) ends of every problem block."""
+    used: np.ndarray = (grid != SPACE).any(axis=0)
+    # +1 where a block starts, -1 just past where it ends
+    edges: np.ndarray = np.diff(used.astype(np.int8), prepend=0, append=0)
+    return np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+
+
+def block_is_sum(grid: np.ndarray, starts: np.ndarray) -> list[bool]:
+    """Return, per block, whether its operator is '+' (otherwise '*')."""
+    return (np.add.reduceat(grid[-1] == PLUS, starts) > 0).tolist()
+
+
+def column_numbers(grid: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Read every column's digits top to bottom as one number.
+
+    Args:
+        grid: Worksheet array, operator row included.
+
+    Returns:
+        (values, has_digits): the number in each column, and whether the
+        column holds any digit at all.
+
+    """
+    digits: np.ndarray = grid[:-1].T
+    is_digit: np.ndarray = digits != SPACE
+
+    dtype: type = np.int64 if digits.shape[1] <= MAX_INT64_DIGITS else object
+    values: np.ndarray = np.zeros(digits.shape[0], dtype=dtype)
+    for r in range(digits.shape[1]):
+        mask: np.ndarray = is_digit[:, r]
+        values[mask] = values[mask] * 10 + (digits[mask, r] - ZERO).astype(dtype)
+
+    return values, is_digit.any(axis=1)
+
+
+def part1(data: list[str]) -> int:
+    """Each row of a block holds one number; the operator row picks + or *."""
+    if not data:
+        return 0
+
+    grid: np.ndarray = to_array(data)
+    starts, ends = block_bounds(grid)
+    rows: list[bytes] = [row.tobytes() for row in grid[:-1]]
+
+    total = 0
+    for c0, c1, is_sum in zip(
+        starts.tolist(), ends.tolist(), block_is_sum(grid, starts), strict=True
+    ):
+        # int() ignores the padding spaces around each number
+        nums: list[int] = [int(row[c0:c1]) for row in rows]
+        total += sum(nums) if is_sum else multiply(nums)
+
+    return total
+
+
+def part2(data: list[str]) -> int:
+    """Each column of a block holds one number, read top to bottom."""
+    if not data:
+        return 0
+
+    grid: np.ndarray = to_array(data)
+    starts, ends = block_bounds(grid)
+    values, has_digits = column_numbers(grid)
+
+    # Drop digit-less columns, then find each block's slice of what is left
+    numbers: list[int] = values[has_digits].tolist()
+    kept: np.ndarray = np.concatenate(([0], np.cumsum(has_digits)))
+    lo: list[int] = kept[starts].tolist()
+    hi: list[int] = kept[ends].tolist()
+
+    total = 0
+    for a, b, is_sum in zip(lo, hi, block_is_sum(grid, starts), strict=True):
+        nums: list[int] = numbers[a:b]
+        total += sum(nums) if is_sum else multiply(nums)
+
+    return total
+
+
+# =============================================================================
+# MAIN
+# =============================================================================
+if __name__ == "__main__":
+    import time
+
+    from src.aoc2025.solutions.day06.utils import parse
+
+    # Example data
+    example: list[str] = parse("src/aoc2025/solutions/day06/example.txt")
+    print("Testing with example data:")
+    try:
+        # Time Part 1
+        start: float = time.perf_counter()
+        p1_answer: int = part1(example)
+        p1_time: float = time.perf_counter() - start
+
+        print(f"Part 1: {p1_answer:6} ({p1_time * 1000:7.3f}ms)")
+    except NameError as e:
+        print(f"Warning: Solution 'Initial' missing required function: {e}")
+
+    try:
+        # Time Part 2
+        start: float = time.perf_counter()
+        p2_answer: int = part2(example)
+        p2_time: float = time.perf_counter() - start
+
+        print(f"Part 2: {p2_answer:6} ({p2_time * 1000:7.3f}ms)")
+    except NameError as e:
+        print(f"Warning: Solution 'Initial' missing required function: {e}  - skipping")
+
+    # Real data
+    try:
+        data: list[str] = parse("src/aoc2025/solutions/day06/input.txt")
+        print("\n\nTesting with real puzzle input:")
+        try:
+            # Time Part 1
+            start: float = time.perf_counter()
+            p1_answer: int = part1(data)
+            p1_time: float = time.perf_counter() - start
+
+            print(f"Part 1: {p1_answer:6} ({p1_time * 1000:7.3f}ms)")
+        except NameError as e:
+            print(f"Warning: Solution 'Initial' missing required function: {e}")
+
+        try:
+            # Time Part 2
+            start: float = time.perf_counter()
+            p2_answer: int = part2(data)
+            p2_time: float = time.perf_counter() - start
+
+            print(f"Part 2: {p2_answer:6} ({p2_time * 1000:7.3f}ms)")
+        except NameError as e:
+            print(
+                f"Warning: Solution 'Initial' missing required function: {e}  - skipping",
+            )
+    except FileNotFoundError:
+        print("\n(Real puzzle input not found - skipping)")
@@ -88,7 +88,7 @@ def compare_solutions(
 
     """
     if solutions is None:
-        solutions = ["initial", "basic", "optimized", "elegant"]
+        solutions = ["initial", "basic", "optimized", "elegant", "vectorized"]
 
     results: list[SolutionResult] = []
 